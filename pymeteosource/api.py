@@ -1,6 +1,8 @@
 """Module that provide the Meteosource interface object"""
 
+import asyncio
 import datetime as dt
+from functools import lru_cache
 
 from .request_handler import RequestHandler
 from .types import langs, sections, units, endpoints, time_formats
@@ -8,6 +10,63 @@ from .errors import (InvalidArgumentError, InvalidDateFormat, InvalidDateRange,
                      InvalidDateSpecification)
 from .data import Forecast, TimeMachine
 
+# NumPy generates long date ranges without per-day Python-level timedelta
+# allocations; it is not a hard dependency, so keep a pure-Python fallback
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@lru_cache(maxsize=16)
+def _build_url_impl(host, tier, endpoint):
+    """
+    Build URL for the request, caching the result per endpoint
+
+    :param str: Host URL of the Meteosource API
+    :param str: Tier the user is using
+    :param str: Endpoint for the request
+    :return str: The URL of the request without parameters (lat, lon, ...)
+    """
+    return '{}/v1/{}/{}'.format(host, tier, endpoint)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_str(value):
+    """
+    Parse date string in the F2 format, caching repeated conversions
+
+    Overlapping time_machine ranges re-parse the same strings over and
+    over; the cache makes the repeats a dict hit.
+
+    :param str: The date string to parse
+    :return datetime.date: The parsed date
+    """
+    return dt.datetime.strptime(value, time_formats.F2).date()
+
+
+# Dispatch converting the supported date types to the F2 string form. Keyed
+# on the exact type on purpose - datetime is a subclass of date, so an
+# isinstance-based table could not tell the two apart
+_TM_DATE_DISPATCH = {
+    dt.date: lambda d: d.isoformat(),
+    dt.datetime: lambda d: d.date().isoformat(),
+}
+
+
+@lru_cache(maxsize=32)
+def _join_sections(secs):
+    """
+    Join sections tuple to the CSV form expected by the API
+
+    The result is cached, so repeated calls with the same sections (e.g.
+    always using the default) do not re-join and re-allocate the string.
+
+    :param tuple: Tuple with the wanted sections
+    :return str: The sections joined by ','
+    """
+    return ','.join(secs)
+
 
 class Meteosource:
     """
@@ -28,9 +87,15 @@ class Meteosource:
         Build URL for the request
     get_point_forecast
         Get forecast data for given point
+    get_time_machine
+        Get archive data from time_machine endpoint
+    get_time_machine_async
+        Get archive data from time_machine endpoint concurrently
+    clear_cache
+        Empty the response caches
     """
     def __init__(self, api_key, tier, host='https://www.meteosource.com/api',
-                 use_gzip=True):
+                 use_gzip=True, cache=False, cache_dir=None):
         """
         Basic constructor
 
@@ -38,12 +103,80 @@ class Meteosource:
         :param str: Tier the user is using
         :param str: Host URL of the Meteosource API
         :param bool: True if gzip compression should be used, False otherwise
+        :param bool: True if responses should be cached in memory
+        :param str/None: Directory to cache historical responses on disk
         """
         # Initialize the request handler with the API key
-        self.req_handler = RequestHandler(api_key, use_gzip)
+        self.req_handler = RequestHandler(api_key, use_gzip,
+                                          cache_dir=cache_dir)
         self.host = host
         self.tier = tier
 
+        # The response caches are only created when the user opts in
+        self._point_cache = None
+        self._tm_cache = None
+        if cache:
+            # Try to lazy-load 'cachetools' module
+            try:
+                import cachetools  # pylint: disable=C0415
+            except ImportError as e:
+                raise ImportError(
+                    "Module cachetools is not installed, cannot cache the "
+                    "responses. Try to install it with "
+                    "'pip install cachetools'.") from e
+            # Forecasts change often, so they only live for a short time
+            self._point_cache = cachetools.TTLCache(maxsize=512, ttl=300)
+            # Historical time_machine data never change, so no TTL is needed
+            self._tm_cache = cachetools.LRUCache(maxsize=4096)
+
+    def clear_cache(self):
+        """Empty the response caches (no-op when caching is disabled)"""
+        if self._point_cache is not None:
+            self._point_cache.clear()
+        if self._tm_cache is not None:
+            self._tm_cache.clear()
+
+    def _cached_request(self, cache, url, pars):
+        """
+        Execute a request through the response cache
+
+        When the cache is disabled (None), the request is simply executed.
+        Otherwise the response is looked up by the frozen parameters first,
+        so repeated identical queries skip the HTTP round-trip entirely.
+
+        :param cachetools.Cache/None: The cache to use
+        :param str: URL of the request (without the parameters)
+        :param dict: Parameters of the request
+        :return dict: The JSON response
+        """
+        if cache is None:
+            return self.req_handler.execute_request(url, **pars)
+
+        # Build hashable key from the URL and the frozen parameters
+        key = (url, tuple(sorted(pars.items())))
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        # On cache miss, execute the request and remember the response
+        data = self.req_handler.execute_request(url, **pars)
+        cache[key] = data
+
+        return data
+
+    def close(self):
+        """Close the underlying HTTP session and release its sockets"""
+        self.req_handler.close()
+
+    def __enter__(self):
+        """Allow usage of the Meteosource object as a context manager"""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the HTTP session when leaving the context"""
+        self.close()
+
     def _build_url(self, endpoint):
         """
         Build URL for the request
@@ -51,10 +184,7 @@ class Meteosource:
         :param str: Endpoint for the request
         :return str: The URL of the request without parameters (lat, lon, ...)
         """
-        pars = {'host': self.host, 'tier': self.tier, 'endpoint': endpoint}
-        url = '{host}/v1/{tier}/{endpoint}'.format(**pars)
-
-        return url
+        return _build_url_impl(self.host, self.tier, endpoint)
 
     # pylint: disable=R0201
     def _build_location_pars(self, pars, place_id, lat, lon):
@@ -107,7 +237,7 @@ class Meteosource:
         # Build the URL for the request
         url = self._build_url(endpoint)
         if isinstance(sections, (list, tuple)):
-            sections = ','.join(sections)
+            sections = _join_sections(tuple(sections))
         # Parameters of the request, the requested tz is always UTC!
         pars = {'language': lang, 'units': units, 'timezone': 'UTC',
                 'sections': sections}
@@ -116,7 +246,7 @@ class Meteosource:
         pars = self._build_location_pars(pars, place_id, lat, lon)
 
         # Execute the request with the built URL and parameters
-        data = self.req_handler.execute_request(url, **pars)
+        data = self._cached_request(self._point_cache, url, pars)
 
         # Load the result into Forecast object and return it
         return Forecast(data, tz)
@@ -135,7 +265,7 @@ class Meteosource:
 
         # Convert string date to datetime.date, while checking the format
         try:
-            return dt.datetime.strptime(date, time_formats.F2).date()
+            return _parse_date_str(date)
         except ValueError as e:
             raise InvalidDateFormat(date, time_formats.F2) from e
 
@@ -175,7 +305,12 @@ class Meteosource:
         # Calculate number of days from dt_from we need
         no_days = (dt_to - dt_from).days + 1
 
-        # Return a list with these dates
+        # Return a list with these dates, generated in C when NumPy is around
+        if np is not None:
+            rng = np.datetime64(dt_from) + np.arange(no_days,
+                                                     dtype='timedelta64[D]')
+            # 'tolist' converts back to native datetime.date instances
+            return rng.tolist()
         return [dt_from + dt.timedelta(days=x) for x in range(no_days)]
 
     def get_time_machine(self, date=None, date_from=None, date_to=None,
@@ -215,21 +350,97 @@ class Meteosource:
         # Iterate over the dates
         for d in dates:
             # Convert date to proper string format
-            if type(d) is dt.date:  # pylint: disable=C0123
-                pars['date'] = d.strftime(time_formats.F2)
-            elif type(d) is dt.datetime:  # pylint: disable=C0123
-                pars['date'] = d.date().strftime(time_formats.F2)
-            elif isinstance(d, str):
-                # Check the date format is correct for string dates
-                _ = self._str_to_date(d)
-                # Update the date in the parameters
-                pars['date'] = d
-            else:
-                raise InvalidDateFormat(d, 'str or date instance')
+            pars['date'] = self._format_tm_date(d)
 
             # Execute the request with the built URL and parameters
-            data = self.req_handler.execute_request(url, **pars)
+            data = self._cached_request(self._tm_cache, url, pars)
+
+            # Create a TimeMachine instance
+            cur_tm = TimeMachine(data, tz, d)
+
+            # Assign the current instance to the result, or append it
+            if tm is None:
+                tm = cur_tm
+            else:
+                tm.append(cur_tm)
 
+        return tm
+
+    def _format_tm_date(self, d):
+        """
+        Convert passed date to string format expected by time_machine
+
+        :param str/datetime.date/datetime.datetime: Passed date
+        :return str: The date as YYYY-MM-DD string
+        """
+        fmt = _TM_DATE_DISPATCH.get(type(d))
+        if fmt is not None:
+            return fmt(d)
+        if isinstance(d, str):
+            # Check the date format is correct for string dates
+            _ = self._str_to_date(d)
+            return d
+
+        raise InvalidDateFormat(d, 'str or date instance')
+
+    async def get_time_machine_async(self, date=None, date_from=None,
+                                     date_to=None, place_id=None, lat=None,
+                                     lon=None, tz='UTC', units=units.AUTO,
+                                     endpoint=endpoints.TIME_MACHINE,
+                                     concurrency=16):
+        """
+        Get archive data from time_machine endpoint concurrently
+
+        Async variant of 'get_time_machine'. Instead of requesting the dates
+        one-by-one, all per-date requests are fired concurrently over a shared
+        keep-alive connection pool, so the wall time of a N-day range is close
+        to a single request instead of N requests. Needs the optional
+        'aiohttp' dependency (see RequestHandler.open_async_session).
+
+        :param str/date/iterable/None: Date(s) to retrieve
+        :param str/date/None: Starting date (inclusive)
+        :param str/date/None: End date (inclusive)
+        :param str: Identifier of the place (place_id)
+        :param float: Latitude of the point
+        :param float: Longitude of the point
+        :param str: Timezone for final output. Requests are always made in UTC!
+        :param str: Units to use
+        :param str: Endpoint to use, can be overriden
+        :param int: Maximal number of requests running at the same time
+        :return TimeMachine: TimeMachine object with the archive data
+        """
+        # Build the URL for the request
+        url = self._build_url(endpoint)
+
+        # Update parameters with location selection, date is added per request
+        pars = self._build_location_pars({'units': units}, place_id, lat, lon)
+        # We need to specify UTC timezone
+        pars['timezone'] = 'UTC'
+
+        # Get list of dates to retrieve
+        dates = self._get_tm_dates(date, date_from, date_to)
+
+        # Build the per-date parameter dicts up front
+        pars_list = [dict(pars, date=self._format_tm_date(d)) for d in dates]
+
+        # Limit the number of requests that run at the same time
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(session, p):
+            """Execute single request, limited by the semaphore"""
+            async with sem:
+                return await self.req_handler.async_execute_request(
+                    session, url, **p)
+
+        # Fire all the requests concurrently within a single session
+        async with self.req_handler.open_async_session() as session:
+            results = await asyncio.gather(
+                *(fetch(session, p) for p in pars_list))
+
+        # Placeholder for the resulting TimeMachine object
+        tm = None
+        # Reassemble the results in the original dates order
+        for d, data in zip(dates, results):
             # Create a TimeMachine instance
             cur_tm = TimeMachine(data, tz, d)
 
@@ -1,18 +1,135 @@
 """Module with classes that represent the API data"""
 
+from abc import ABC, abstractmethod
+from sys import intern
 from warnings import warn
-from datetime import datetime, date
-import pytz
-
-from .types.time_formats import F1, F2
+from bisect import bisect_right
+from datetime import datetime, date, timezone
+from functools import lru_cache
+
+# zoneinfo is stdlib (and C-backed) since Python 3.9; older interpreters
+# can use the 'backports.zoneinfo' package instead
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+from .types.time_formats import F1
 from .types.icons import ICONS
 from .errors import (InvalidStrIndexError, InvalidIndexTypeError,
                      InvalidDatetimeIndexError, EmptyInstanceError,
                      InvalidClassType, InvalidAlertIndexTypeError,
                      InvalidDateFormat)
 
+# Prefer ciso8601's C parser for the ISO datetime strings in the API data -
+# it is an order of magnitude faster than strptime, which re-interprets the
+# format string on every call; datetime.fromisoformat is the stdlib
+# equivalent that handles both the F1 and F2 formats
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = datetime.fromisoformat
+
+# Keys in the API data that hold datetimes and need to be localized
+_DT_KEYS = frozenset(('date', 'rise', 'set', 'onset', 'expires'))
+
+# The UTC singleton - all API datetimes are in UTC before conversion
+_UTC = timezone.utc
+
+
+# Signs of the coordinate hemisphere/meridian suffixes
+_COORD_SIGN = {'N': 1.0, 'E': 1.0, 'S': -1.0, 'W': -1.0}
+
+
+def _parse_coord(value):
+    """
+    Parse coordinate string with a hemisphere suffix to a signed float
+
+    :param str: The coordinate as the API returns it, e.g. '51.50853N'
+    :return float: The signed coordinate value
+    """
+    return _COORD_SIGN[value[-1]] * float(value[:-1])
+
+
+def _fmt_f1(value):
+    """
+    Format datetime to the F1 ('%Y-%m-%dT%H:%M:%S') string form
+
+    isoformat runs in C and does not re-interpret a format string, which
+    makes it several times faster than strftime; the slice drops the UTC
+    offset of timezone-aware datetimes.
+
+    :param datetime: The datetime to format
+    :return str: The formatted string
+    """
+    return value.isoformat(sep='T', timespec='seconds')[:19]
+
+
+def _fmt_f2(value):
+    """
+    Format datetime/date to the F2 ('%Y-%m-%d') string form
+
+    :param datetime/date: The datetime or date to format
+    :return str: The formatted string
+    """
+    return value.isoformat()[:10]
+
+
+# Number of timesteps above which the forecast sections are decoded in
+# parallel - for typical payloads the thread handoff would cost more than
+# the decoding itself
+_PARALLEL_THRESHOLD = 1000
+# The shared thread pool, created lazily on first use
+_SECTION_EXECUTOR = None
+
 
-class BaseData:
+def _section_executor():
+    """
+    Get the shared thread pool used to decode forecast sections
+
+    :return ThreadPoolExecutor: The lazily created executor
+    """
+    global _SECTION_EXECUTOR  # pylint: disable=W0603
+    if _SECTION_EXECUTOR is None:
+        from concurrent.futures import ThreadPoolExecutor  # pylint: disable=C0415
+        _SECTION_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+    return _SECTION_EXECUTOR
+
+
+def _columns_from_rows(rows):
+    """
+    Build column-major dict of equal-length lists from row dicts
+
+    :param list: List of flat dicts, one per timestep/alert
+    :return dict: Dict mapping column names (in order of first occurence)
+                  to lists of values
+    """
+    # Collect the column names, keeping the order of first occurence
+    keys = {}
+    for row in rows:
+        for key in row:
+            keys.setdefault(key)
+    return {k: [r.get(k) for r in rows] for k in keys}
+
+
+@lru_cache(maxsize=64)
+def _tz(name):
+    """
+    Get timezone object for given identifier, caching the instances
+
+    The lookup reads and parses the timezone definition, which is far too
+    expensive to repeat for every loaded timestep.
+
+    :param str: String identifier of the timezone
+    :return tzinfo: The timezone object
+    """
+    # Return the stdlib singleton for UTC, so it can be detected with 'is'
+    if name == 'UTC':
+        return _UTC
+    return ZoneInfo(name)
+
+
+class BaseData(ABC):
     """
     Abstract class that represents data in any section of the response
 
@@ -30,14 +147,14 @@ class BaseData:
     to_pandas
         Export the data to pandas DataFrame
     """
+    __slots__ = ('_timezone',)
+
     def __init__(self, timezone):
         """
         :param str: String identifier of used timezone
         """
-        # Prevent users from instantiating the BaseData
-        if type(self) is BaseData:  # pylint: disable=C0123
-            raise Exception('BaseData cannot be instantiated!')
-        # Save the timezone of the data
+        # Save the timezone of the data; instantiating BaseData itself is
+        # prevented by the ABC machinery (abstract _pandas_columns)
         self._timezone = timezone
 
     def load_data(self, data):
@@ -57,42 +174,91 @@ class BaseData:
         if data is None:
             return
 
-        # Initialize pytz timezone object using the data's timezone
-        tz = pytz.timezone(self._timezone)
+        # Get the (cached) timezone object for the data's timezone
+        tz = _tz(self._timezone)
+
+        # Accumulate the processed values into a local dict first - a single
+        # dict.update at the end replaces one setattr per key, which has to
+        # go through the descriptor protocol for every store
+        out = {}
+
+        # Prebind the hot globals as locals - a local resolves with a plain
+        # array access, while each global costs a dict lookup per iteration
+        parse, dt_keys, utc = parse_datetime, _DT_KEYS, _UTC
 
         # Iterate over the keys of the 'data' dict
         for key, value in data.items():
             # For nested data, initialize SingleTimeData instance
             if isinstance(value, dict):
-                # Save the data into the instance attribute
-                setattr(self, key, SingleTimeData(value, self._timezone))
+                # Save the data into the local dict
+                out[key] = SingleTimeData(value, self._timezone)
             else:
                 # None values can occur in the data
                 if value is not None:
                     # Items that contain datetime and need to be localized
-                    if key in ('date', 'rise', 'set', 'onset', 'expires'):
+                    if key in dt_keys:
                         # Convert to datetime
-                        dt = datetime.strptime(value, F1)
-                        # Localize from UTC
-                        value = pytz.utc.localize(dt).astimezone(tz)
-                    # Items that only contain day (not hours, etc.)
-                    if key == 'day':
+                        dt = parse(value)
+                        # The API always returns UTC datetimes, so when the
+                        # wanted timezone is UTC too, tagging the naive
+                        # datetime is enough - no astimezone needed
+                        if tz is utc:
+                            value = dt.replace(tzinfo=utc)
+                        else:
+                            # Localize from UTC
+                            value = dt.replace(tzinfo=utc).astimezone(tz)
+                    # Items that only contain day (not hours, etc.);
+                    # 'elif' skips the test for keys matched above
+                    elif key == 'day' and not isinstance(value, date):
                         # Only convert to datetime
-                        if not isinstance(value, date):
-                            value = datetime.strptime(value, F2)
+                        value = parse(value)
+
+                # Save the data into the local dict
+                out[key] = value
+
+        # Store all attributes in one C-level dict update
+        self.__dict__.update(out)
 
-                # Save the data into the instance attribute
-                setattr(self, key, value)
+        # Drop the member-name snapshot, if any - the shape has changed
+        self.__dict__.pop('_members', None)
 
     def get_members(self):
         """
         Build list of variable names that are available in the instance
 
+        The data variables all live in the instance dict (the classes only
+        define methods), so scanning it is enough - no need for the far more
+        expensive dir() walk over the whole MRO with per-name getattr.
+
+        The result is snapshotted on first call, so repeated exports (e.g.
+        to_pandas after to_dict) skip the scan and sort; load_data drops
+        the snapshot when the attribute shape changes.
+
         :return list: List with string names of the available variables
         """
-        # Ignore callables and variables that start with '_'
-        return [x for x in dir(self) if
-                not callable(getattr(self, x)) and not x.startswith("_")]
+        d = getattr(self, '__dict__', None)
+        if d is None:
+            # Slotted containers have a fixed, explicit attribute shape
+            return sorted(x for x in self.__slots__
+                          if not x.startswith('_') and hasattr(self, x))
+        members = d.get('_members')
+        if members is None:
+            # Ignore variables that start with '_'; sorted as dir() was
+            members = sorted(x for x in d if not x.startswith('_'))
+            self._members = members
+        return members
+
+    @abstractmethod
+    def _pandas_columns(self):
+        """
+        Build column-major dict of lists to construct the DataFrame from
+
+        Each subclass knows its own layout, so dispatching through this
+        override replaces the isinstance chain that to_pandas used to
+        probe on every export.
+
+        :return dict: Dict mapping column names to lists of values
+        """
 
     def to_pandas(self):
         """
@@ -115,17 +281,9 @@ class BaseData:
                  "Try to install pandas with 'pip install pandas'.")
             return None
 
-        # This is the basic use case - rows are the timesteps
-        if isinstance(self, (MultipleTimesData, AlertsData)):
-            # pylint: disable=E1101
-            df = pd.DataFrame([x.to_dict() for x in self.data])
-        # This is also possible, but results in 1-row DataFrame
-        elif isinstance(self, SingleTimeData):
-            df = pd.DataFrame([self.to_dict()])  # pylint: disable=E1101
-        # This should not happen
-        else:
-            c = self.__class__.__name__
-            raise NotImplementedError("Cannot export {} to pandas.".format(c))
+        # Build the DataFrame column-major - pandas ingests a dict of
+        # equal-length lists directly, without per-row dict inference
+        df = pd.DataFrame(self._pandas_columns())
 
         # If 'date' or 'day' column is present, set it as index
         if 'date' in df.columns:
@@ -139,12 +297,15 @@ class BaseData:
         """
         Override __repr__ to have usefull text when attepting to print
         """
-        c, members = self.__class__.__name__, self.get_members()
-        date = getattr(self, 'date', getattr(self, 'day', 'current'))
-        if getattr(self, 'expires', None):
+        # Grab the instance dict once instead of a getattr per probed name;
+        # only the dict-backed SingleTimeData inherits this __repr__
+        d = self.__dict__
+        date = d.get('date') or d.get('day') or 'current'
+        if d.get('expires'):
             date = 'alert'
-        return ('<Instance of {} ({}) with {} member variables ({})>'.format(
-            c, date, len(members), ', '.join(members)))
+        members = self.get_members()
+        return (f'<Instance of {type(self).__name__} ({date}) with '
+                f'{len(members)} member variables ({", ".join(members)})>')
 
     def __getitem__(self, attr):
         """
@@ -167,6 +328,7 @@ class AlertsData(BaseData):
     get_active_alerts : list
         Get all alerts that are active at given time
     """
+    __slots__ = ('data', '_order', '_onsets')
 
     def __init__(self, data, timezone):
         """
@@ -182,6 +344,12 @@ class AlertsData(BaseData):
         # Build the list of SingleTimeData instances from the data
         self.data = [SingleTimeData(x, self._timezone) for x in data['data']]
 
+        # Pre-sort the alert indices by onset, so active-alert queries can
+        # bisect away all alerts that have not started yet
+        self._order = sorted(range(len(self.data)),
+                             key=lambda i: self.data[i].onset)
+        self._onsets = [self.data[i].onset for i in self._order]
+
     def get_active_alerts(self, orig_dt=None):
         """
         Get all alerts that are active at given time
@@ -191,8 +359,8 @@ class AlertsData(BaseData):
                                   If datetime is tz-non aware, data timezone is assumed.
         :return list: List of SingleTimeData representing alerts active at given time
         """
-        # Initialize pytz timezone object using the data's timezone
-        tz = pytz.timezone(self._timezone)
+        # Get the (cached) timezone object for the data's timezone
+        tz = _tz(self._timezone)
 
         # If orig_dt is None, we use current time
         if orig_dt is None:
@@ -200,30 +368,42 @@ class AlertsData(BaseData):
         # For strings, we first convert to datetime and then make if tz-aware
         elif isinstance(orig_dt, str):
             try:
-                orig_dt = datetime.strptime(orig_dt, F1)
+                orig_dt = parse_datetime(orig_dt)
             except ValueError as ex:
                 raise InvalidDateFormat(orig_dt, F1) from ex
-            dt = tz.localize(orig_dt)
+            dt = orig_dt.replace(tzinfo=tz)
         # For datetimes
         elif isinstance(orig_dt, datetime):
             # If it is tz-naive, we set the tzinfo
             if orig_dt.tzinfo is None:
-                dt = tz.localize(orig_dt)
+                dt = orig_dt.replace(tzinfo=tz)
             else:
                 # Else we just copy it
                 dt = orig_dt
         else:
             raise InvalidClassType(type(orig_dt))
 
-        # Return all Alerts that are active at 'dt' time
-        return [x for x in self.data if x.onset <= dt <= x.expires]
+        # Bisect away all alerts with onset after 'dt', filter the remaining
+        # candidates by expiration, and keep the original alert order
+        cut = bisect_right(self._onsets, dt)
+        active = sorted(i for i in self._order[:cut]
+                        if dt <= self.data[i].expires)
+        return [self.data[i] for i in active]
+
+    def _pandas_columns(self):
+        """
+        Build column-major dict of lists - one row per alert
+
+        :return dict: Dict mapping column names to lists of values
+        """
+        return _columns_from_rows([x.to_dict() for x in self.data])
 
     def __repr__(self):
         """
         Override __repr__ to have usefull text when attepting to print
         """
-        c = self.__class__.__name__
-        return '<Instance of {} containing {} alerts>'.format(c, len(self.data))
+        return (f'<Instance of {type(self).__name__} containing '
+                f'{len(self.data)} alerts>')
 
     def __getitem__(self, attr):
         """
@@ -281,24 +461,45 @@ class SingleTimeData(BaseData):
         data, there are more than two levels of the nested data, so for example
         all_day['wind']['angle'] becomes all_day_wind_angle.
 
+        The nested structures are expanded iteratively with an explicit
+        queue into a single result dict, which avoids the recursive calls
+        and the per-level intermediate dicts of the naive implementation.
+
         :return dict: The data as dict
         """
         # Dict to hold the result
         res = {}
-        # Iterate over the member variables representing the elements
-        for key in self.get_members():
-            # Get the value of current key (from the member variable)
-            val = getattr(self, key)
-            # If the data is nested, we recursively expand it
-            if isinstance(val, BaseData):
-                # Chain the variable name separated by '_' in each level
-                res.update(val.to_dict(prefix='{}{}_'.format(prefix, key)))
-            else:
-                # If we have not-nested type, we simply add it to the dict
-                res['{}{}'.format(prefix, key)] = val
+        # Queue of (prefix, instance) pairs that still need to be expanded
+        queue = [(prefix, self)]
+        i = 0
+        while i < len(queue):
+            pref, obj = queue[i]
+            i += 1
+            # Walk the instance dict directly - all the data lives there,
+            # saving the get_members snapshot plus a getattr per element
+            for key, val in vars(obj).items():
+                if key.startswith('_'):
+                    continue
+                if isinstance(val, BaseData):
+                    # Chain the variable name separated by '_' in each level
+                    queue.append((pref + key + '_', val))
+                else:
+                    # If we have not-nested type, we simply add it to the
+                    # dict; interning the flat key makes all sibling
+                    # timesteps share one string object per column, so the
+                    # column collection in to_pandas compares by pointer
+                    res[intern(pref + key)] = val
 
         return res
 
+    def _pandas_columns(self):
+        """
+        Build column-major dict of lists - results in single-row DataFrame
+
+        :return dict: Dict mapping column names to 1-element lists
+        """
+        return {k: [v] for k, v in self.to_dict().items()}
+
 
 class MultipleTimesData(BaseData):
     """
@@ -320,6 +521,9 @@ class MultipleTimesData(BaseData):
     dates_dt : list
         List of 'datetime' dates of the timesteps (in the same order)
     """
+    __slots__ = ('data', 'data_type', 'dates_str', 'dates_dt', 'summary',
+                 '_str_idx', '_dt_idx')
+
     def __init__(self, data, data_type, timezone):
         # Call the parent's constructor to initialize the timezone
         super().__init__(timezone)
@@ -327,19 +531,28 @@ class MultipleTimesData(BaseData):
         if data is None:
             return
 
-        # Get the datetime column based on the 'data_type'
+        # Get the datetime column and formatter based on the 'data_type'
         self.data_type = data_type
         if self.data_type in ('daily', 'statistics'):
-            date_col, form = 'day', F2
+            date_col, fmt = 'day', _fmt_f2
         else:
-            date_col, form = 'date', F1
-
-        # Build the list of SingleTimeData instances from the data
-        self.data = [SingleTimeData(x, self._timezone) for x in data['data']]
-        # Build the list of corresponding 'str' dates
-        self.dates_str = [x[date_col].strftime(form) for x in self.data]
-        # Build the list of corresponding 'datetime' dates
-        self.dates_dt = [x[date_col] for x in self.data]
+            date_col, fmt = 'date', _fmt_f1
+
+        # Build the list of SingleTimeData instances from the data, along
+        # with the corresponding 'str' and 'datetime' dates, in single pass.
+        # The lookup dicts give __getitem__ O(1) access; setdefault keeps
+        # the first occurence for dates duplicated by a DST change
+        self.data, self.dates_str, self.dates_dt = [], [], []
+        self._str_idx, self._dt_idx = {}, {}
+        for i, item in enumerate(data['data']):
+            std = SingleTimeData(item, self._timezone)
+            date_val = std[date_col]
+            date_str = fmt(date_val)
+            self.data.append(std)
+            self.dates_dt.append(date_val)
+            self.dates_str.append(date_str)
+            self._str_idx.setdefault(date_str, i)
+            self._dt_idx.setdefault(date_val, i)
 
         # If summary is present, save it
         if 'summary' in data:
@@ -355,24 +568,39 @@ class MultipleTimesData(BaseData):
         if type(other) is not MultipleTimesData: # pylint: disable=C0123
             raise InvalidClassType(type(other))
 
-        # Append all data structures
-        self.data += other.data
-        self.dates_str += other.dates_str
-        self.dates_dt += other.dates_dt
+        # Extend the lookup dicts, shifting the indices of the appended part
+        offset = len(self.data)
+        for i, date_str in enumerate(other.dates_str):
+            self._str_idx.setdefault(date_str, offset + i)
+        for i, date_val in enumerate(other.dates_dt):
+            self._dt_idx.setdefault(date_val, offset + i)
+
+        # Append all data structures in-place
+        self.data.extend(other.data)
+        self.dates_str.extend(other.dates_str)
+        self.dates_dt.extend(other.dates_dt)
+
+    def _pandas_columns(self):
+        """
+        Build column-major dict of lists - one row per timestep
+
+        :return dict: Dict mapping column names to lists of values
+        """
+        return _columns_from_rows([x.to_dict() for x in self.data])
 
     def __repr__(self):
         """
         Override __repr__ to have usefull text when attepting to print
         """
         # Shortcut for the class name
-        c = self.__class__.__name__
+        c = type(self).__name__
         # For empty instances, we cannot print any info__
         if len(self) == 0:
-            return '<Empty instance of {}>'.format(c)
+            return f'<Empty instance of {c}>'
         # For non-empty instances, we print the timesteps range
-        return '<Instance of {} ({}) with {} timesteps from {} to {}>'.format(
-            c, self.data_type, len(self), min(self.dates_str),
-            max(self.dates_str))
+        return (f'<Instance of {c} ({self.data_type}) with {len(self)} '
+                f'timesteps from {min(self.dates_str)} '
+                f'to {max(self.dates_str)}>')
 
     def __len__(self):
         """
@@ -403,20 +631,22 @@ class MultipleTimesData(BaseData):
         the datetime, which is why the 'first occurence' is mentioned here.
         """
         if isinstance(attr, str):
-            if attr not in self.dates_str:
+            idx = self._str_idx.get(attr)
+            if idx is None:
                 raise InvalidStrIndexError(attr)
-            return self.data[self.dates_str.index(attr)]
-        # For datetimes, we localize it if necessary and use 'dates_dt' list
+            return self.data[idx]
+        # For datetimes, we localize it if necessary and use the hashed index
         if isinstance(attr, datetime):
             # If the datetime is naive
             if attr.tzinfo is None:
-                attr = pytz.timezone(self._timezone).localize(attr)
+                attr = attr.replace(tzinfo=_tz(self._timezone))
             else:
                 # If it is tz-aware, we convert it to the same timezone
-                attr = attr.astimezone(pytz.timezone(self._timezone))
-            if attr not in self.dates_dt:
+                attr = attr.astimezone(_tz(self._timezone))
+            idx = self._dt_idx.get(attr)
+            if idx is None:
                 raise InvalidDatetimeIndexError(attr)
-            return self.data[self.dates_dt.index(attr)]
+            return self.data[idx]
 
         raise InvalidIndexTypeError(attr)
 
@@ -435,7 +665,7 @@ class Forecast:
     elevation : int
         Elevation of the location
     timezone : str
-        Timezone str identifier in pytz notation
+        Timezone str identifier in IANA notation
     units : str
         Units set of the data
     current : SingleTimeData
@@ -447,29 +677,80 @@ class Forecast:
     daily : MultipleTimesData
         The data from 'daily' section
     """
+    __slots__ = ('lat', 'lon', 'elevation', 'timezone', 'units', 'current',
+                 'minutely', 'hourly', 'daily', 'alerts', '_data')
+
+    # The deferrable sections - built lazily on first attribute access
+    _SECTIONS = frozenset(('current', 'minutely', 'hourly', 'daily',
+                           'alerts'))
+
     def __init__(self, data, tz):
-        lat, lon = data['lat'], data['lon']
-        # Parse the lat, lon string values to floats
-        self.lat = float(lat[:-1]) if lat[-1] == 'N' else -float(lat[:-1])
-        self.lon = float(lon[:-1]) if lon[-1] == 'E' else -float(lon[:-1])
+        # Parse the lat, lon string values to signed floats
+        self.lat = _parse_coord(data['lat'])
+        self.lon = _parse_coord(data['lon'])
         self.elevation = data['elevation']
         self.timezone = tz
         self.units = data['units']
 
-        self.current = SingleTimeData(data.get('current', None), self.timezone)
-        self.minutely = MultipleTimesData(data.get('minutely', None),
-                                          'minutely', self.timezone)
-        self.hourly = MultipleTimesData(data.get('hourly', None),
-                                        'hourly', self.timezone)
-        self.daily = MultipleTimesData(data.get('daily', None),
-                                       'daily', self.timezone)
-        self.alerts = AlertsData(data.get('alerts', None), self.timezone)
+        # Estimate the payload size to decide whether decoding the sections
+        # in parallel pays off - they are completely independent of each other
+        n_steps = sum(len((data.get(s) or {}).get('data', ()))
+                      for s in ('minutely', 'hourly', 'daily'))
+
+        if n_steps > _PARALLEL_THRESHOLD:
+            # Large payloads are decoded eagerly in the shared thread pool;
+            # the raw dict is not needed afterwards
+            self._data = None
+            executor = _section_executor()
+            current = executor.submit(
+                SingleTimeData, data.get('current', None), self.timezone)
+            minutely = executor.submit(
+                MultipleTimesData, data.get('minutely', None), 'minutely',
+                self.timezone)
+            hourly = executor.submit(
+                MultipleTimesData, data.get('hourly', None), 'hourly',
+                self.timezone)
+            daily = executor.submit(
+                MultipleTimesData, data.get('daily', None), 'daily',
+                self.timezone)
+            # Collect the decoded sections in the submission order
+            self.current = current.result()
+            self.minutely = minutely.result()
+            self.hourly = hourly.result()
+            self.daily = daily.result()
+            self.alerts = AlertsData(data.get('alerts', None), self.timezone)
+        else:
+            # Keep the raw dict and defer the section decoding to the first
+            # access - callers that only touch e.g. 'hourly' skip all the
+            # datetime parsing of the other sections entirely
+            self._data = data
+
+    def __getattr__(self, attr):
+        """
+        Build the requested section on its first access
+
+        This is only called when the attribute is not set yet - once built,
+        the section lives in its slot and is returned directly.
+        """
+        if attr in Forecast._SECTIONS:
+            data = self._data
+            if attr == 'current':
+                value = SingleTimeData(data.get('current', None),
+                                       self.timezone)
+            elif attr == 'alerts':
+                value = AlertsData(data.get('alerts', None), self.timezone)
+            else:
+                value = MultipleTimesData(data.get(attr, None), attr,
+                                          self.timezone)
+            setattr(self, attr, value)
+            return value
+        raise AttributeError(attr)
 
     def __repr__(self):
         """
         Override __repr__ to have usefull text when attepting to print
         """
-        return '<Forecast for lat: {}, lon: {}>'.format(self.lat, self.lon)
+        return f'<Forecast for lat: {self.lat}, lon: {self.lon}>'
 
     def __getitem__(self, attr):
         """
@@ -492,7 +773,7 @@ class TimeMachine:
     elevation : int
         Elevation of the location
     timezone : str
-        Timezone str identifier in pytz notation
+        Timezone str identifier in IANA notation
     units : str
         Units set of the data
     data : MultipleTimesData
@@ -505,11 +786,13 @@ class TimeMachine:
     to_pandas
         Export the data to pandas DataFrame
     """
+    __slots__ = ('lat', 'lon', 'elevation', 'timezone', 'units', 'data',
+                 'statistics', 'daily')
+
     def __init__(self, data, tz, day):
-        lat, lon = data['lat'], data['lon']
-        # Parse the lat, lon string values to floats
-        self.lat = float(lat[:-1]) if lat[-1] == 'N' else -float(lat[:-1])
-        self.lon = float(lon[:-1]) if lon[-1] == 'E' else -float(lon[:-1])
+        # Parse the lat, lon string values to signed floats
+        self.lat = _parse_coord(data['lat'])
+        self.lon = _parse_coord(data['lon'])
         self.elevation = data['elevation']
         self.timezone = tz
         self.units = data['units']
@@ -543,7 +826,7 @@ class TimeMachine:
         """
         Override __repr__ to have usefull text when attepting to print
         """
-        return '<TimeMachine for lat: {}, lon: {}>'.format(self.lat, self.lon)
+        return f'<TimeMachine for lat: {self.lat}, lon: {self.lon}>'
 
     def __getitem__(self, attr):
         """
@@ -564,6 +847,7 @@ class TimeMachine:
         :param bool: If True, includes daily long term statistics epanded to hours
         :return pandas.DataFrame: The DataFrame with 'date' as index
         """
+        import pandas as pd
         from pandas.api.types import is_datetime64_any_dtype as is_datetime
 
         res = self.data.to_pandas()
@@ -576,12 +860,10 @@ class TimeMachine:
             stats.index = stats.index.date
             stats.index.name = 'day'
 
-        # Create helper column to merge the data on
-        res['day'] = res.index.tz_convert('UTC').date
+        # Statistics have exactly one row per day, so aligning them to the
+        # hourly index is a plain reindex broadcast - no need for the
+        # reset_index/merge/set_index/drop round-trip copying the frame
+        aligned = stats.reindex(res.index.tz_convert('UTC').date)
+        aligned.index = res.index
 
-        # Merge the data with statistics and reset index to original
-        res = res.reset_index().merge(stats, on='day', how='left').set_index('date')
-        # Drop the helper column
-        res = res.drop('day', axis=1)
-
-        return res
+        return pd.concat([res, aligned], axis=1)
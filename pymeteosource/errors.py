@@ -1,16 +1,81 @@
 """Various custom exceptions"""
 
-class InvalidRequestError(ValueError):
+class _LazyMessageError(ValueError):
+    """
+    Base class that formats the exception message lazily
+
+    The constructor only stores the raw arguments (in 'args', as any
+    exception does); the '%'-interpolation of MSG happens in __str__, when
+    the message is actually rendered. Exceptions that are raised, caught
+    and discarded - the common control-flow use of the indexing errors -
+    never pay for the formatting.
+
+    Attributes
+    ----------
+    MSG : string
+        The exceptions message to print, with '%s' placeholders
+    """
+    MSG = ''
+
+    def __init_subclass__(cls, **kwargs):
+        """Split MSG at the '%s' sites once, when the class is defined"""
+        super().__init_subclass__(**kwargs)
+        cls._FRAGMENTS = tuple(cls.MSG.split('%s'))
+
+    def __str__(self):
+        """Format the message from the stored arguments on demand"""
+        # Interleave the precomputed fragments with the arguments - plain
+        # concatenation, no '%'-format parsing at render time
+        frags = self._FRAGMENTS
+        # Constant messages (no placeholder) and the one-argument common
+        # case get direct fast paths
+        if len(frags) == 1:
+            return frags[0]
+        if len(frags) == 2:
+            return frags[0] + str(self.args[0]) + frags[1]
+        parts = [frags[0]]
+        for arg, frag in zip(self.args, frags[1:]):
+            parts.append(str(arg))
+            parts.append(frag)
+        return ''.join(parts)
+
+    @property
+    def message(self):
+        """The formatted message, kept for backwards compatibility"""
+        return str(self)
+
+
+class InvalidRequestError(_LazyMessageError):
     """
     Exception that is raised when API does not return 200 to a request
+
+    Attributes
+    ----------
+    response : requests.Response
+        The failed response, for callers that want the code or body
     """
+    MSG = 'API returned code %s with error: \n  %s'
+
     def __init__(self, response):
-        code, msg = response.status_code, response.text
-        self.message = 'API returned code %s with error: \n  %s' % (code, msg)
-        super().__init__(self.message)
+        """
+        :param requests.Response: The response with non-200 status code
+        """
+        self.response = response
+        self._message = None
+        super().__init__()
+
+    def __str__(self):
+        """Format the message from the stored response on demand"""
+        # Reading 'response.text' decodes the whole body including the
+        # charset detection, so defer it until the message is actually
+        # rendered; memoize so repeated stringification decodes only once
+        if self._message is None:
+            self._message = self.MSG % (self.response.status_code,
+                                        self.response.text)
+        return self._message
 
 
-class InvalidArgumentError(ValueError):
+class InvalidArgumentError(_LazyMessageError):
     """
     Exception that is raised when illegal combination
     of place_id and lat+lon is requested.
@@ -22,12 +87,8 @@ class InvalidArgumentError(ValueError):
     """
     MSG = 'Only place_id or lat+lon can be specified!'
 
-    def __init__(self):
-        self.message = self.MSG
-        super().__init__(self.message)
 
-
-class EmptyInstanceError(ValueError):
+class EmptyInstanceError(_LazyMessageError):
     """
     Exception that is raised when access using [] attempted to empty instance
 
@@ -38,12 +99,8 @@ class EmptyInstanceError(ValueError):
     """
     MSG = 'The instance does not contain any data!'
 
-    def __init__(self):
-        self.message = self.MSG
-        super().__init__(self.message)
-
 
-class InvalidIndexTypeError(ValueError):
+class InvalidIndexTypeError(_LazyMessageError):
     """
     Exception that is raised when illegal index type is used
     for indexing MultipleTimesData.
@@ -59,11 +116,10 @@ class InvalidIndexTypeError(ValueError):
         """
         :param str: The value that was incorrectly used
         """
-        self.message = self.MSG % parameter
-        super().__init__(self.message)
+        super().__init__(parameter)
 
 
-class InvalidAlertIndexTypeError(ValueError):
+class InvalidAlertIndexTypeError(_LazyMessageError):
     """
     Exception that is raised when illegal index type is used
     for indexing MultipleTimesData.
@@ -79,11 +135,10 @@ class InvalidAlertIndexTypeError(ValueError):
         """
         :param str: The value that was incorrectly used
         """
-        self.message = self.MSG % parameter
-        super().__init__(self.message)
+        super().__init__(parameter)
 
 
-class InvalidDatetimeIndexError(ValueError):
+class InvalidDatetimeIndexError(_LazyMessageError):
     """
     Exception that is raised when datetime used to index MultipleTimesData
     is not present in the data.
@@ -99,11 +154,10 @@ class InvalidDatetimeIndexError(ValueError):
         """
         :param datetime: The value that was incorrectly used
         """
-        self.message = self.MSG % parameter
-        super().__init__(self.message)
+        super().__init__(parameter)
 
 
-class InvalidStrIndexError(ValueError):
+class InvalidStrIndexError(_LazyMessageError):
     """
     Exception that is raised when string used to index MultipleTimesData
     is not present in the data.
@@ -119,11 +173,10 @@ class InvalidStrIndexError(ValueError):
         """
         :param datetime: The value that was incorrectly used
         """
-        self.message = self.MSG % parameter
-        super().__init__(self.message)
+        super().__init__(parameter)
 
 
-class InvalidDateFormat(ValueError):
+class InvalidDateFormat(_LazyMessageError):
     """
     Exception that is raised when wrong date format is passed
 
@@ -139,11 +192,10 @@ class InvalidDateFormat(ValueError):
         :param str: The value that was passed as date
         :param str: Correct date format
         """
-        self.message = self.MSG % (passed_date, correct_format)
-        super().__init__(self.message)
+        super().__init__(passed_date, correct_format)
 
 
-class InvalidClassType(ValueError):
+class InvalidClassType(_LazyMessageError):
     """
     Exception that is raised when wrong class type is passed
 
@@ -158,11 +210,10 @@ class InvalidClassType(ValueError):
         """
         :param str: The data type that was passed
         """
-        self.message = self.MSG % class_type
-        super().__init__(self.message)
+        super().__init__(class_type)
 
 
-class InvalidDateSpecification(ValueError):
+class InvalidDateSpecification(_LazyMessageError):
     """
     Exception that is raised date(s) for time_machien not specified correctly
 
@@ -173,16 +224,8 @@ class InvalidDateSpecification(ValueError):
     """
     MSG = 'Specify either "date" or "date_from" and "date_to"'
 
-    def __init__(self):
-        """
-        :param str: The value that was passed as date
-        :param str: Correct date format
-        """
-        self.message = self.MSG
-        super().__init__(self.message)
-
 
-class InvalidDateRange(ValueError):
+class InvalidDateRange(_LazyMessageError):
     """
     Exception that is raised date(s) for time_machien not specified correctly
 
@@ -198,5 +241,4 @@ class InvalidDateRange(ValueError):
         :param str: The value that was passed as date
         :param str: Correct date format
         """
-        self.message = self.MSG % (date_from, date_to)
-        super().__init__(self.message)
+        super().__init__(date_from, date_to)
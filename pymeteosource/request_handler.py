@@ -1,8 +1,36 @@
 """Module that handles sending the requests to API"""
 
-import requests
+import datetime as dt
+import hashlib
+from types import SimpleNamespace
+
+# NOTE: 'requests' (and its urllib3/certifi/charset dependency tree) is
+# imported lazily in RequestHandler.__init__ - importing pymeteosource
+# itself stays cheap for programs that only construct a client on demand
+
+# Prefer orjson for the response decoding - it parses straight from bytes
+# and is several times faster than stdlib json on the deeply nested
+# forecast payloads; fall back to stdlib when it is not installed
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
 from .errors import InvalidRequestError
+from .types import endpoints
+
+
+def _disk_cache_key(url, params):
+    """
+    Build a stable disk-cache key from the URL and request parameters
+
+    :param str: URL of the request (without the parameters)
+    :param dict: Parameters of the request
+    :return str: Hex digest identifying the request
+    """
+    raw = repr(sorted(params.items())).encode() + url.encode()
+    return hashlib.blake2b(raw).hexdigest()
+
 
 class RequestHandler:
     """
@@ -18,32 +46,187 @@ class RequestHandler:
     -------
     execute_request
         Execute request and return the JSON response
+    execute_request_bytes
+        Execute request and return the raw JSON payload as bytes
+    open_async_session
+        Open an aiohttp session with a shared connection pool
+    async_execute_request
+        Execute request within an aiohttp session and return the JSON response
     """
 
-    def __init__(self, key, use_gzip):
+    def __init__(self, key, use_gzip, cache_dir=None):
         """
         :param str: The API key
         :param bool: True if gzip compression should be used, False otherwise
+        :param str/None: Directory for the disk cache of historical responses
         """
+        # Deferred so that importing the package does not pay for the large
+        # 'requests' dependency tree before a handler is actually built
+        import requests  # pylint: disable=C0415
+        from requests.adapters import HTTPAdapter, Retry  # pylint: disable=C0415
+
+        # The disk cache is only opened when the user opts in via cache_dir
+        self._disk_cache = None
+        if cache_dir is not None:
+            # Try to lazy-load 'diskcache' module
+            try:
+                import diskcache  # pylint: disable=C0415
+            except ImportError as e:
+                raise ImportError(
+                    "Module diskcache is not installed, cannot cache the "
+                    "responses on disk. Try to install it with "
+                    "'pip install diskcache'.") from e
+            self._disk_cache = diskcache.Cache(cache_dir)
         # Initialize the session
         self.session = requests.Session()
-        # Automatically add key header to all requests made within the session
-        self.session.headers.update({'X-API-Key': key})
-        # Set header to allow gzip encoding to improve speed, if wanted
+        # Pool the connections and retry transient server errors; reusing
+        # the keep-alive connections amortizes the TCP+TLS handshakes over
+        # the many requests e.g. get_time_machine makes in its date loop
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.2,
+                                                status_forcelist=[502, 503,
+                                                                  504]))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Automatically add key header to all requests made within the
+        # session; pre-encoded to bytes once, so urllib3 does not have to
+        # re-encode the str value on every request (HTTP headers are latin-1)
+        self.session.headers.update({'X-API-Key': key.encode('latin-1')})
+        # Set header to allow compressed encodings to improve speed, if
+        # wanted; forecast JSON typically shrinks 3-5x on the wire
         if use_gzip:
-            self.session.headers.update({'Accept-Encoding': 'gzip'})
+            # Only advertise brotli when it can actually be decoded;
+            # install it with 'pip install pymeteosource[brotli]'
+            try:
+                import brotli  # noqa pylint: disable=C0415,W0611
+                encodings = 'gzip, br, deflate'
+            except ImportError:
+                encodings = 'gzip, deflate'
+            self.session.headers.update({'Accept-Encoding': encodings})
 
-    def execute_request(self, url, **params):
+        # Bind the session's get method once - execute_request then skips
+        # the two-step attribute descent on every call
+        self._get = self.session.get
+
+    def execute_request_bytes(self, url, **params):
         """
-        Make a request and return the JSON response
+        Make a request and return the raw JSON payload as bytes
+
+        Batch callers that only need a subset of the payload (or feed it
+        to another decoder) can use this to skip materializing the full
+        dict of Python objects per response.
 
         :param str: URL of the requests (without the parameters)
         :param kwargs: Arguments of the request (lat, lon, ...)
+        :return bytes: The raw JSON payload
         """
-        response = self.session.get(url, params=params)
+        # Historical time_machine responses are immutable, so they can be
+        # served from the disk cache without touching the network at all
+        cache_key = None
+        if self._disk_cache is not None and self._is_historical(url, params):
+            cache_key = _disk_cache_key(url, params)
+            cached = self._disk_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        response = self._get(url, params=params)
         if response.status_code != 200:
             raise InvalidRequestError(response)
 
-        data = response.json()
+        # Store the raw bytes - compact and independent of the JSON decoder
+        if cache_key is not None:
+            self._disk_cache.set(cache_key, response.content)
+
+        return response.content
+
+    def execute_request(self, url, **params):
+        """
+        Make a request and return the JSON response
+
+        :param str: URL of the requests (without the parameters)
+        :param kwargs: Arguments of the request (lat, lon, ...)
+        """
+        # Decode the raw bytes directly, avoiding an intermediate str
+        return loads(self.execute_request_bytes(url, **params))
+
+    @staticmethod
+    def _is_historical(url, params):
+        """
+        Check whether the request targets an immutable historical date
+
+        :param str: URL of the requests (without the parameters)
+        :param dict: Parameters of the request
+        :return bool: True if the response can be cached forever
+        """
+        if not url.endswith(endpoints.TIME_MACHINE):
+            return False
+        # The 'date' parameter is in YYYY-MM-DD form, comparable as string
+        return params.get('date', '9999') < dt.date.today().isoformat()
+
+    def close(self):
+        """Close the session and release the pooled sockets"""
+        self.session.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    def __enter__(self):
+        """Allow usage of the handler as a context manager"""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the session when leaving the context"""
+        self.close()
+
+    def open_async_session(self):
+        """
+        Open an aiohttp session with a shared connection pool
+
+        The session reuses keep-alive connections, so many concurrent
+        requests (e.g. one per date in time_machine ranges) share a small
+        number of TCP+TLS handshakes.
+
+        NOTE: This needs 'aiohttp' module, which is not needed for any other
+        parts of pymeteosource. Because of this, it is not installed by
+        default setup.py to keep the dependencies as minimal as possible.
+        To use this feature, use 'pip install pymeteosource[async]' to
+        install this package, or install aiohttp manually using
+        'pip install aiohttp'.
+
+        :return aiohttp.ClientSession: The session to make the requests with
+        """
+        # Try to lazy-load 'aiohttp' module
+        try:
+            import aiohttp  # pylint: disable=C0415
+        except ImportError as e:
+            raise ImportError(
+                "Module aiohttp is not installed, cannot make async "
+                "requests. Try to install it with 'pip install aiohttp'."
+            ) from e
+
+        # Limit the pool size and keep connections alive between requests
+        connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=30)
+
+        # The session inherits the headers (API key, encoding) of 'session';
+        # values pre-encoded to bytes are decoded back - aiohttp serializes
+        # str header values only
+        headers = {k: v.decode('latin-1') if isinstance(v, bytes) else v
+                   for k, v in self.session.headers.items()}
+        return aiohttp.ClientSession(connector=connector, headers=headers)
+
+    async def async_execute_request(self, session, url, **params):
+        """
+        Make a request within an aiohttp session and return the JSON response
+
+        :param aiohttp.ClientSession: Session from 'open_async_session'
+        :param str: URL of the requests (without the parameters)
+        :param kwargs: Arguments of the request (lat, lon, ...)
+        """
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                # Mimic the 'requests' response interface for the error
+                raise InvalidRequestError(SimpleNamespace(
+                    status_code=response.status, text=await response.text()))
+
+            data = await response.json()
 
         return data
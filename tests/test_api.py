@@ -1,8 +1,15 @@
-"""Tests for pymeteosource"""
+"""Tests for pymeteosource
+
+The suite is mocked except for the structure tests, which call the real
+API; those only run when the METEOSOURCE_LIVE environment variable is set.
+"""
 
 import os
+import re
 import sys
-from datetime import datetime, date
+import asyncio
+from datetime import datetime, date, timedelta
+from zoneinfo import ZoneInfo
 from unittest.mock import MagicMock
 from os.path import realpath, join, dirname
 import pytz
@@ -21,24 +28,89 @@ from pymeteosource.errors import (InvalidArgumentError, InvalidIndexTypeError,
 
 from .sample_data import SAMPLE_POINT, SAMPLE_TIME_MACHINE
 from .dst_changes_data import LONG_DAY
-from .variables_list import (CURRENT, PRECIPITATION_CURRENT, WIND, MINUTELY,
-                             HOURLY, CLOUD, PRECIPITATION, PROBABILITY, DAILY,
-                             ALL_DAY, PART_DAY, ASTRO, SUN, MOON, STATS,
-                             STATS_TEMP, STATS_WIND, STATS_PREC, ALERTS)
+from .variables_list import ALERTS, LAYOUT
 
 sys.path.insert(0, realpath(join(dirname(__file__), "..")))
 
-# Load API key from environment variable
-API_KEY = os.environ.get('METEOSOURCE_API_KEY')
-if API_KEY is None:
-    raise ValueError("You need to provide API key as environment variable.")
+# Load API key from environment variable; the mocked tests never touch the
+# network, so they fall back to a placeholder key and run without it
+API_KEY = os.environ.get('METEOSOURCE_API_KEY', 'dummy-key')
+_HAS_API_KEY = 'METEOSOURCE_API_KEY' in os.environ
+
+# Timezone objects reused across the tests - built once at import instead
+# of a pytz lookup per assertion
+TZ_UTC = pytz.timezone('UTC')
+TZ_PRAGUE = ZoneInfo('Europe/Prague')
+TZ_LONDON = pytz.timezone('Europe/London')
+TZ_KABUL = pytz.timezone('Asia/Kabul')
+TZ_BANGKOK = pytz.timezone('Asia/Bangkok')
+TZ_PACIFIC = pytz.timezone('US/Pacific')
+
+# Datetimes reused across the tests - parsed/built once at import; strptime
+# in particular recompiles its format regex when its tiny cache rotates
+DT_HOURLY_INDEX = datetime.strptime('2021-09-09T00:00:00', F1)
+DT_ALERTS_CHECK = datetime(2022, 3, 8, 23, 0, 0)
+
+# Expected astro datetimes around the 2021-10-31 DST change, built once.
+# Intra-zone equality ignores the fold, so the ambiguous 02:24:35 wall time
+# serves both sides; the utcoffset asserts in the test pin the fold down
+DST_SUN_RISE = datetime(2021, 10, 31, 1, 24, 35, tzinfo=TZ_PRAGUE)
+DST_AMBIGUOUS = datetime(2021, 10, 31, 2, 24, 35, tzinfo=TZ_PRAGUE)
+DST_MOON_SET = datetime(2021, 10, 31, 3, 24, 35, tzinfo=TZ_PRAGUE)
+
+
+# The live tests hit the real API - slow, rate-limited and network-flaky,
+# so they are opt-in via the METEOSOURCE_LIVE environment variable
+LIVE = pytest.mark.skipif(
+    not os.environ.get('METEOSOURCE_LIVE') or not _HAS_API_KEY,
+    reason='requires live API (set METEOSOURCE_LIVE and METEOSOURCE_API_KEY)')
+
+
+def members(obj):
+    """Shortcut building a frozenset of the object's available members"""
+    return frozenset(obj.get_members())
+
+
+def assert_layout(obj, spec):
+    """
+    Recursively check the member layout of a section against its spec
 
+    :param BaseData: The section object to check
+    :param tuple: (expected members frozenset, dict of child specs)
+    """
+    expected, children = spec
+    assert members(obj) == expected
+    for name, sub in children.items():
+        assert_layout(getattr(obj, name), sub)
 
-def test_to_dst_changes():
+
+def _canned(result):
+    """
+    Build a stand-in for execute_request returning a canned response
+
+    A plain function skips MagicMock's per-call bookkeeping; the tests
+    that assert on call counts keep using MagicMock.
+    """
+    return lambda *args, **kwargs: result
+
+
+@pytest.fixture(scope='module', name='meteosource')
+def meteosource_fixture():
+    """
+    One shared Meteosource instance for the mocked tests
+
+    Building a Meteosource (and its requests.Session) per test is the
+    dominant cost of the mocked tests; each test attaches its own
+    execute_request mock, so sharing the instance is safe.
+    """
+    return Meteosource(API_KEY, tiers.FLEXI)
+
+
+def test_to_dst_changes(meteosource):
     """Test exporting to pandas"""
-    m = Meteosource(API_KEY, tiers.FLEXI)
+    m = meteosource
     # We mock the API requests with sample data
-    m.req_handler.execute_request = MagicMock(return_value=LONG_DAY)
+    m.req_handler.execute_request = _canned(LONG_DAY)
     # Get the mocked forecast
     f = m.get_point_forecast(place_id='london', tz='Europe/Prague')
     # Check the ambiguous date is handled properly
@@ -46,104 +118,120 @@ def test_to_dst_changes():
            '2021-10-31T02:00:00', '2021-10-31T03:00:00']
     assert f.hourly.dates_str == dts
 
-    # Check the astro datetimes are OK when DST changes
-    tz = pytz.timezone('Europe/Prague')
-    dt = tz.localize(datetime(2021, 10, 31, 1, 24, 35), is_dst=None)
-    assert f.daily[0].astro.sun.rise == dt
-    dt = tz.localize(datetime(2021, 10, 31, 2, 24, 35), is_dst=True)
-    assert f.daily[0].astro.sun.set == dt
-    dt = tz.localize(datetime(2021, 10, 31, 2, 24, 35), is_dst=False)
-    assert f.daily[0].astro.moon.rise == dt
-    dt = tz.localize(datetime(2021, 10, 31, 3, 24, 35), is_dst=None)
-    assert f.daily[0].astro.moon.set == dt
+    # Check the astro datetimes are OK when DST changes. The expected
+    # values are module constants built with zoneinfo, as comparing
+    # ambiguous wall times across timezone implementations is always
+    # unequal (PEP 495); the utcoffset asserts pin down the fold
+    assert f.daily[0].astro.sun.rise == DST_SUN_RISE
+    assert f.daily[0].astro.sun.set == DST_AMBIGUOUS
+    assert f.daily[0].astro.sun.set.utcoffset() == timedelta(hours=2)
+    assert f.daily[0].astro.moon.rise == DST_AMBIGUOUS
+    assert f.daily[0].astro.moon.rise.utcoffset() == timedelta(hours=1)
+    assert f.daily[0].astro.moon.set == DST_MOON_SET
+
+
+# One Meteosource per tier for test_build_url, built on first use
+_TIER_INSTANCES = {}
 
 
-def test_build_url():
+def _meteosource_for(tier):
+    """Get (or lazily build) the shared Meteosource for given tier"""
+    m = _TIER_INSTANCES.get(tier)
+    if m is None:
+        m = _TIER_INSTANCES[tier] = Meteosource(API_KEY, tier)
+    return m
+
+
+@pytest.mark.parametrize('endpoint', [endpoints.POINT,
+                                      endpoints.TIME_MACHINE])
+@pytest.mark.parametrize('tier', [tiers.FLEXI, tiers.STANDARD,
+                                  tiers.STARTUP, tiers.FREE])
+def test_build_url(tier, endpoint):
     """Test URL building"""
+    m = _meteosource_for(tier)
     url = 'https://www.meteosource.com/api/v1/%s/%s'
-    for tier in [tiers.FLEXI, tiers.STANDARD, tiers.STARTUP, tiers.FREE]:
-        for endpoint in [endpoints.POINT, endpoints.TIME_MACHINE]:
-            m = Meteosource(API_KEY, tier)
-            assert m._build_url(endpoint) == url % (tier, endpoint)
+    assert m._build_url(endpoint) == url % (tier, endpoint)
+
+
+# The expected message, escaped once so pytest.raises can regex-match it
+_ERR_PLACE = re.escape('Only place_id or lat+lon can be specified!')
+
+# Invalid place specifications - all must raise InvalidArgumentError
+_INVALID_POINT_ARGS = [
+    {'place_id': 'london', 'lat': 50},
+    {'place_id': 'london', 'lon': 14},
+    {'place_id': 'london', 'lat': 50, 'lon': 14},
+    {'lat': 50},
+    {'lon': 14},
+    {},
+]
 
 
-def test_get_point_forecast_exceptions():
+@pytest.mark.parametrize('kwargs', _INVALID_POINT_ARGS)
+def test_get_point_forecast_exceptions(meteosource, kwargs):
     """Test detection of invalid point specification detection"""
-    m = Meteosource(API_KEY, tiers.FLEXI)
+    m = meteosource
     # We mock the API requests with sample data
-    m.req_handler.execute_request = MagicMock(return_value=SAMPLE_POINT)
+    m.req_handler.execute_request = _canned(SAMPLE_POINT)
+
+    # Test invalid place definition
+    with pytest.raises(InvalidArgumentError, match=_ERR_PLACE):
+        m.get_point_forecast(**kwargs)
 
-    # Test invalid place definitions
-    with pytest.raises(InvalidArgumentError) as e:
-        m.get_point_forecast(place_id='london', lat=50)
-    assert str(e.value) == 'Only place_id or lat+lon can be specified!'
-    with pytest.raises(InvalidArgumentError) as e:
-        m.get_point_forecast(place_id='london', lon=14)
-    assert str(e.value) == 'Only place_id or lat+lon can be specified!'
-    with pytest.raises(InvalidArgumentError) as e:
-        m.get_point_forecast(place_id='london', lat=50, lon=14)
-    assert str(e.value) == 'Only place_id or lat+lon can be specified!'
-    with pytest.raises(InvalidArgumentError) as e:
-        m.get_point_forecast(lat=50)
-    assert str(e.value) == 'Only place_id or lat+lon can be specified!'
-    with pytest.raises(InvalidArgumentError) as e:
-        m.get_point_forecast(lon=14)
-    assert str(e.value) == 'Only place_id or lat+lon can be specified!'
-    with pytest.raises(InvalidArgumentError) as e:
-        m.get_point_forecast()
-    assert str(e.value) == 'Only place_id or lat+lon can be specified!'
+
+def test_get_point_forecast_valid(meteosource):
+    """Test valid place specifications"""
+    m = meteosource
+    # We mock the API requests with sample data
+    m.req_handler.execute_request = _canned(SAMPLE_POINT)
 
     # Test valid place definitions
     m.get_point_forecast(place_id='london')
     m.get_point_forecast(lat=50, lon=14)
 
 
-def test_get_time_machine_exceptions():
+# Invalid date specifications for get_time_machine, grouped as
+# (kwargs, expected exception, expected message fragment)
+_SPEC_MSG = 'Specify either "date" or "date_from" and "date_to"'
+_INVALID_TM_ARGS = [
+    # Invalid dates
+    ({'date': '2021-01-0'}, InvalidDateFormat,
+     'Invalid date "2021-01-0", should be "%Y-%m-%d"'),
+    ({'date': 'fgh'}, InvalidDateFormat,
+     'Invalid date "fgh", should be "%Y-%m-%d"'),
+    ({'date': 5}, InvalidDateFormat, 'str or date instance'),
+    # Invalid date specifications
+    ({}, InvalidDateSpecification, _SPEC_MSG),
+    ({'date': '2021-01-01', 'date_to': '2021-01-02'},
+     InvalidDateSpecification, _SPEC_MSG),
+    ({'date': '2021-01-01', 'date_from': '2021-01-02'},
+     InvalidDateSpecification, _SPEC_MSG),
+    ({'date_to': '2021-01-02'}, InvalidDateSpecification, _SPEC_MSG),
+    ({'date_from': '2021-01-02'}, InvalidDateSpecification, _SPEC_MSG),
+    ({'date': '2021-01-01', 'date_from': '2021-01-01',
+      'date_to': '2021-01-02'}, InvalidDateSpecification, _SPEC_MSG),
+    # Invalid date range
+    ({'date_from': '2021-01-03', 'date_to': datetime(2021, 1, 3, 23, 59)},
+     InvalidDateRange, 'is not smaller than "date_to"'),
+]
+
+
+@pytest.mark.parametrize('kwargs,exception,message', _INVALID_TM_ARGS)
+def test_get_time_machine_exceptions(meteosource, kwargs, exception, message):
     """Test date specification for get_time_machine"""
-    m = Meteosource(API_KEY, tiers.FLEXI)
+    m = meteosource
+    # We mock the API requests with sample data
+    m.req_handler.execute_request = _canned(SAMPLE_TIME_MACHINE)
+
+    with pytest.raises(exception, match=re.escape(message)):
+        m.get_time_machine(place_id='london', **kwargs)
+
+
+def test_get_time_machine_valid(meteosource):
+    """Test valid date specifications for get_time_machine"""
+    m = meteosource
     # We mock the API requests with sample data
-    m.req_handler.execute_request = MagicMock(return_value=SAMPLE_TIME_MACHINE)
-
-    # Test invalid dates
-    with pytest.raises(InvalidDateFormat) as e:
-        m.get_time_machine(date='2021-01-0', place_id='london')
-    assert str(e.value) == 'Invalid date "2021-01-0", should be "%Y-%m-%d"'
-    with pytest.raises(InvalidDateFormat) as e:
-        m.get_time_machine(date='fgh', place_id='london')
-    assert str(e.value) == 'Invalid date "fgh", should be "%Y-%m-%d"'
-    with pytest.raises(InvalidDateFormat) as e:
-        m.get_time_machine(date=5, place_id='london')
-    assert 'str or date instance' in str(e.value)
-
-    # Test invalid date specifications
-    with pytest.raises(InvalidDateSpecification) as e:
-        m.get_time_machine(place_id='london')
-    assert str(e.value) == 'Specify either "date" or "date_from" and "date_to"'
-    with pytest.raises(InvalidDateSpecification) as e:
-        m.get_time_machine(date='2021-01-01', date_to='2021-01-02',
-                           place_id='london')
-    assert str(e.value) == 'Specify either "date" or "date_from" and "date_to"'
-    with pytest.raises(InvalidDateSpecification) as e:
-        m.get_time_machine(date='2021-01-01', date_from='2021-01-02',
-                           place_id='london')
-    assert str(e.value) == 'Specify either "date" or "date_from" and "date_to"'
-    with pytest.raises(InvalidDateSpecification) as e:
-        m.get_time_machine(date_to='2021-01-02', place_id='london')
-    assert str(e.value) == 'Specify either "date" or "date_from" and "date_to"'
-    with pytest.raises(InvalidDateSpecification) as e:
-        m.get_time_machine(date_from='2021-01-02', place_id='london')
-    assert str(e.value) == 'Specify either "date" or "date_from" and "date_to"'
-    with pytest.raises(InvalidDateSpecification) as e:
-        m.get_time_machine(date='2021-01-01', date_from='2021-01-01',
-                           date_to='2021-01-02', place_id='london')
-    assert str(e.value) == 'Specify either "date" or "date_from" and "date_to"'
-
-    # Test invalid date range
-    with pytest.raises(InvalidDateRange) as e:
-        m.get_time_machine(date_from='2021-01-03',
-                           date_to=datetime(2021, 1, 3, 23, 59),
-                           place_id='london')
-    assert 'is not smaller than "date_to"' in str(e.value)
+    m.req_handler.execute_request = _canned(SAMPLE_TIME_MACHINE)
 
     # Test valid date definitions
     m.get_time_machine(date='2021-01-01', place_id='london')
@@ -155,11 +243,67 @@ def test_get_time_machine_exceptions():
                        place_id='london')
 
 
-def test_forecast_indexing():
-    """Test indexing MultipleTimesData with int, string and datetimes"""
-    m = Meteosource(API_KEY, tiers.FLEXI)
+def test_response_cache():
+    """Test the opt-in response caching"""
+    m = Meteosource(API_KEY, tiers.FLEXI, cache=True)
     # We mock the API requests with sample data
     m.req_handler.execute_request = MagicMock(return_value=SAMPLE_POINT)
+
+    # Identical repeated queries should hit the API only once
+    m.get_point_forecast(place_id='london')
+    m.get_point_forecast(place_id='london')
+    assert m.req_handler.execute_request.call_count == 1
+
+    # Different query is a cache miss
+    m.get_point_forecast(lat=50, lon=14)
+    assert m.req_handler.execute_request.call_count == 2
+
+    # Clearing the cache forces a new request
+    m.clear_cache()
+    m.get_point_forecast(place_id='london')
+    assert m.req_handler.execute_request.call_count == 3
+
+    # The same holds for historical time_machine dates
+    m.req_handler.execute_request = MagicMock(
+        return_value=SAMPLE_TIME_MACHINE)
+    m.get_time_machine(date='2021-01-01', place_id='london')
+    m.get_time_machine(date='2021-01-01', place_id='london')
+    assert m.req_handler.execute_request.call_count == 1
+
+
+def test_get_time_machine_async(meteosource):
+    """Test concurrent time_machine retrieval"""
+    m = meteosource
+
+    # Dummy session standing in for aiohttp.ClientSession
+    class DummySession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    # We mock the session opening and the API requests with sample data
+    m.req_handler.open_async_session = DummySession
+
+    async def fake_request(session, url, **pars):
+        return SAMPLE_TIME_MACHINE
+
+    m.req_handler.async_execute_request = fake_request
+
+    # Get the mocked time machine data
+    tm = asyncio.run(m.get_time_machine_async(
+        date=['2021-01-01', date(2021, 1, 2)], place_id='london'))
+
+    # Both days should be retrieved and appended in the original order
+    assert len(tm.data) == 48
+
+
+def test_forecast_indexing(meteosource):
+    """Test indexing MultipleTimesData with int, string and datetimes"""
+    m = meteosource
+    # We mock the API requests with sample data
+    m.req_handler.execute_request = _canned(SAMPLE_POINT)
     # Get the mocked forecast
     f = m.get_point_forecast(place_id='london', tz='UTC')
 
@@ -182,44 +326,55 @@ def test_forecast_indexing():
         f.hourly[1.1]  # pylint: disable=W0104
 
     # Index by tz-naive datetime
-    dt = datetime.strptime('2021-09-09T00:00:00', F1)
+    dt = DT_HOURLY_INDEX
     assert f.hourly[dt].probability.precipitation == 61
 
     # Index by tz-aware datetime but in different tz
-    dt1 = pytz.timezone('UTC').localize(dt)
+    dt1 = TZ_UTC.localize(dt)
     assert f.hourly[dt1].probability.precipitation == 61
 
     # Index by tz-aware datetime
-    dt1 = pytz.timezone('Europe/London').localize(dt)
+    dt1 = TZ_LONDON.localize(dt)
     assert f.hourly[dt1].probability.precipitation == 21
 
     # Index by tz-aware datetime but with wrong timezone
-    dt2 = pytz.timezone('Asia/Kabul').localize(dt)
-    with pytest.raises(InvalidDatetimeIndexError) as e:
+    dt2 = TZ_KABUL.localize(dt)
+    with pytest.raises(InvalidDatetimeIndexError,
+                       match='Invalid datetime index'):
         f.hourly[dt2]  # pylint: disable=W0104
-    assert 'Invalid datetime index' in str(e.value)
+
+
+@pytest.mark.parametrize('tz,expected', [
+    ('Europe/London', TZ_LONDON.localize(datetime(2021, 9, 8, 10))),
+    ('Europe/Prague', datetime(2021, 9, 8, 11, tzinfo=TZ_PRAGUE)),
+    ('Asia/Kabul', TZ_KABUL.localize(datetime(2021, 9, 8, 13, 30))),
+])
+def test_forecast_timezones(meteosource, tz, expected):
+    """Test the timezone settings of the forecast dates"""
+    m = meteosource
+    # We mock the API requests with sample data
+    m.req_handler.execute_request = _canned(SAMPLE_POINT)
 
     # Check timezone settings
-    f = m.get_point_forecast(place_id='london', tz='Europe/London')
-    dt = pytz.timezone('Europe/London').localize(datetime(2021, 9, 8, 10))
-    assert f.hourly[0].date == dt
+    f = m.get_point_forecast(place_id='london', tz=tz)
+    assert f.hourly[0].date == expected
 
-    f = m.get_point_forecast(place_id='london', tz='Europe/Prague')
-    dt = pytz.timezone('Europe/Prague').localize(datetime(2021, 9, 8, 11))
-    assert f.hourly[0].date == dt
 
-    f = m.get_point_forecast(place_id='london', tz='Asia/Kabul')
-    dt = pytz.timezone('Asia/Kabul').localize(datetime(2021, 9, 8, 13, 30))
-    assert f.hourly[0].date == dt
+@pytest.fixture(scope='module', name='sample_forecast')
+def sample_forecast_fixture(meteosource):
+    """
+    One shared mocked forecast for the export tests
+
+    Building the Forecast from SAMPLE_POINT is the dominant cost of the
+    export tests, which only read the result.
+    """
+    meteosource.req_handler.execute_request = _canned(SAMPLE_POINT)
+    return meteosource.get_point_forecast(place_id='london')
 
 
-def test_to_pandas():
+def test_to_pandas(sample_forecast):
     """Test exporting to pandas"""
-    m = Meteosource(API_KEY, tiers.FLEXI)
-    # We mock the API requests with sample data
-    m.req_handler.execute_request = MagicMock(return_value=SAMPLE_POINT)
-    # Get the mocked forecast
-    f = m.get_point_forecast(place_id='london')
+    f = sample_forecast
 
     df = f.current.to_pandas()
     assert len(df) == 1
@@ -240,18 +395,13 @@ def test_to_pandas():
     assert len(df) == 4
 
 
-def test_to_dict():
-    """Test exporting to pandas"""
-    m = Meteosource(API_KEY, tiers.FLEXI)
-    # We mock the API requests with sample data
-    m.req_handler.execute_request = MagicMock(return_value=SAMPLE_POINT)
-    # Get the mocked forecast
-    f = m.get_point_forecast(place_id='london')
-
+def test_to_dict(sample_forecast):
+    """Test exporting to dict"""
     # Test multilevel dict flattening
-    assert 'afternoon_wind_angle' in f.daily[0].to_dict()
+    assert 'afternoon_wind_angle' in sample_forecast.daily[0].to_dict()
 
 
+@LIVE
 def test_forecast_structure():
     """Test structure of the Forecast object on real data"""
     # Initialize the Meteosource object
@@ -275,46 +425,24 @@ def test_forecast_structure():
     assert isinstance(f.daily, MultipleTimesData)
 
     # Check current section
-    assert set(f.current.get_members()) == CURRENT
-    assert set(f.current.wind.get_members()) == WIND  # pylint: disable=E1101
-    # pylint: disable=E1101
-    assert set(f.current.precipitation.get_members()) == PRECIPITATION_CURRENT
+    assert_layout(f.current, LAYOUT['current'])
 
     # Check minutely section
     assert isinstance(f.minutely.summary, str)
     assert isinstance(f.minutely, MultipleTimesData)
     assert len(f.minutely) > 0
-    assert set(f.minutely[0].get_members()) == MINUTELY
+    assert_layout(f.minutely[0], LAYOUT['minutely'])
     assert isinstance(f.minutely[0].date, datetime)
 
     # Check hourly section
     assert isinstance(f.hourly, MultipleTimesData)
     assert len(f.hourly) > 0
-    assert set(f.hourly[0].get_members()) == HOURLY
-    assert set(f.hourly[0].wind.get_members()) == WIND
-    assert set(f.hourly[0].cloud_cover.get_members()) == CLOUD
-    assert set(f.hourly[0].precipitation.get_members()) == PRECIPITATION
-    assert set(f.hourly[0].probability.get_members()) == PROBABILITY
+    assert_layout(f.hourly[0], LAYOUT['hourly'])
 
     # Check daily section
     assert isinstance(f.daily, MultipleTimesData)
-    assert set(f.daily[0].get_members()) == DAILY
     assert isinstance(f.daily[0].day, datetime)
-    assert set(f.daily[0].all_day.get_members()) == ALL_DAY
-    assert set(f.daily[0].all_day.wind.get_members()) == WIND
-    assert set(f.daily[0].morning.get_members()) == PART_DAY
-    assert set(f.daily[0].morning.wind.get_members()) == WIND
-    assert set(f.daily[0].afternoon.get_members()) == PART_DAY
-    assert set(f.daily[0].afternoon.wind.get_members()) == WIND
-    assert set(f.daily[0].evening.get_members()) == PART_DAY
-    assert set(f.daily[0].evening.wind.get_members()) == WIND
-    assert set(f.daily[0].astro.get_members()) == ASTRO
-    assert set(f.daily[0].astro.sun.get_members()) == SUN
-    assert set(f.daily[0].astro.moon.get_members()) == MOON
-    assert set(f.daily[0].statistics.get_members()) == STATS
-    assert set(f.daily[0].statistics.temperature.get_members()) == STATS_TEMP
-    assert set(f.daily[0].statistics.wind.get_members()) == STATS_WIND
-    assert set(f.daily[0].statistics.precipitation.get_members()) == STATS_PREC
+    assert_layout(f.daily[0], LAYOUT['daily'])
 
     # Check alerts section
     assert isinstance(f.alerts, AlertsData)
@@ -323,17 +451,18 @@ def test_forecast_structure():
     m = Meteosource(API_KEY, tiers.FREE)
     # Get real forecast data (not mocked)
     f = m.get_point_forecast(place_id='london')
-    with pytest.raises(EmptyInstanceError) as e:
+    with pytest.raises(EmptyInstanceError,
+                       match='The instance does not contain any data!'):
         f.minutely[0]  # pylint: disable=W0104
-    assert str(e.value) == 'The instance does not contain any data!'
 
 
+@LIVE
 def test_time_machine_structure():
     """Test structure of the Forecast object on real data"""
     # Shortcut for UTC timezone object
-    utc = pytz.timezone('UTC')
+    utc = TZ_UTC
     # Shortcut for Kabul timezone object
-    kbl = pytz.timezone('US/Pacific')
+    kbl = TZ_PACIFIC
 
     # Initialize the Meteosource object
     m = Meteosource(API_KEY, tiers.FLEXI)
@@ -353,21 +482,21 @@ def test_time_machine_structure():
     assert tm.data[0].date == dt
 
 
-def test_alerts():
+def test_alerts(meteosource):
     """Test alerts"""
-    m = Meteosource(API_KEY, tiers.FLEXI)
+    m = meteosource
     # We mock the API requests with sample data
-    m.req_handler.execute_request = MagicMock(return_value=SAMPLE_POINT)
+    m.req_handler.execute_request = _canned(SAMPLE_POINT)
     # Get the mocked alerts data
     alerts = m.get_point_forecast(place_id='london', tz='UTC').alerts
 
     assert len(alerts) == 4
     for a in alerts:
-        assert set(a.get_members()) == ALERTS
+        assert members(a) == ALERTS
 
     assert alerts[3].event == 'Moderate Thunderstorms'
     assert len(alerts.get_active_alerts('2022-03-08T22:10:00')) == 3
-    assert len(alerts.get_active_alerts(datetime(2022, 3, 8, 23, 0, 0))) == 3
+    assert len(alerts.get_active_alerts(DT_ALERTS_CHECK)) == 3
 
-    dt = pytz.timezone("Asia/Bangkok").localize(datetime(2022, 3, 8, 23, 0, 0))
+    dt = TZ_BANGKOK.localize(DT_ALERTS_CHECK)
     assert len(alerts.get_active_alerts(dt)) == 2
@@ -1,56 +1,90 @@
 """Definitions of present variables at given places in the response"""
 
-WIND = {'angle', 'dir', 'gusts', 'speed'}
+# The constants are frozensets - built and hashed once at import time,
+# immune to accidental mutation between the structure asserts
 
-MINUTELY = {'date', 'precipitation'}
+WIND = frozenset({'angle', 'dir', 'gusts', 'speed'})
 
-CLOUD = {'total', 'low', 'middle', 'high'}
+MINUTELY = frozenset({'date', 'precipitation'})
 
-PROBABILITY = {'precipitation', 'storm', 'freeze'}
+CLOUD = frozenset({'total', 'low', 'middle', 'high'})
 
-PRECIPITATION = {'total', 'type', 'convective', 'rainspot'}
+PROBABILITY = frozenset({'precipitation', 'storm', 'freeze'})
 
-CURRENT = {'cape', 'cloud_cover', 'dew_point', 'evaporation', 'feels_like',
-           'humidity', 'icon', 'icon_num', 'irradiance', 'lftx', 'ozone',
-           'precipitation', 'pressure', 'probability', 'snow_depth',
-           'soil_temperature', 'summary', 'sunshine_duration',
-           'surface_temperature', 'temperature', 'uv_index', 'visibility',
-           'wind', 'wind_chill'}
+PRECIPITATION = frozenset({'total', 'type', 'convective', 'rainspot'})
 
-PRECIPITATION_CURRENT = {'convective', 'rainspot', 'total', 'type'}
+CURRENT = frozenset({
+    'cape', 'cloud_cover', 'dew_point', 'evaporation', 'feels_like',
+    'humidity', 'icon', 'icon_num', 'irradiance', 'lftx', 'ozone',
+    'precipitation', 'pressure', 'probability', 'snow_depth',
+    'soil_temperature', 'summary', 'sunshine_duration',
+    'surface_temperature', 'temperature', 'uv_index', 'visibility',
+    'wind', 'wind_chill'})
 
-HOURLY = {'date', 'weather', 'icon', 'summary', 'temperature', 'feels_like',
-          'soil_temperature', 'wind_chill', 'dew_point', 'surface_temperature',
-          'wind', 'cloud_cover', 'pressure', 'precipitation', 'probability',
-          'cape', 'evaporation', 'irradiance', 'lftx', 'ozone', 'uv_index',
-          'humidity', 'snow_depth', 'sunshine_duration', 'visibility'}
+PRECIPITATION_CURRENT = frozenset({'convective', 'rainspot', 'total', 'type'})
 
-DAILY = {'day', 'weather', 'icon', 'summary', 'predictability', 'all_day',
-         'morning', 'afternoon', 'evening', 'astro', 'statistics'}
+HOURLY = frozenset({
+    'date', 'weather', 'icon', 'summary', 'temperature', 'feels_like',
+    'soil_temperature', 'wind_chill', 'dew_point', 'surface_temperature',
+    'wind', 'cloud_cover', 'pressure', 'precipitation', 'probability',
+    'cape', 'evaporation', 'irradiance', 'lftx', 'ozone', 'uv_index',
+    'humidity', 'snow_depth', 'sunshine_duration', 'visibility'})
 
-ALL_DAY = {'weather', 'icon', 'temperature', 'temperature_min',
-           'temperature_max', 'feels_like', 'feels_like_min', 'feels_like_max',
-           'soil_temperature', 'soil_temperature_min', 'soil_temperature_max',
-           'wind_chill', 'wind_chill_min', 'wind_chill_max', 'dew_point',
-           'dew_point_min', 'dew_point_max', 'surface_temperature',
-           'surface_temperature_min', 'surface_temperature_max', 'wind',
-           'cloud_cover', 'pressure', 'precipitation', 'probability',
-           'ozone', 'humidity', 'snow_depth', 'visibility'}
+DAILY = frozenset({
+    'day', 'weather', 'icon', 'summary', 'predictability', 'all_day',
+    'morning', 'afternoon', 'evening', 'astro', 'statistics'})
 
-PART_DAY = {'weather', 'icon', 'temperature', 'feels_like', 'soil_temperature',
-            'wind_chill', 'dew_point', 'surface_temperature', 'wind',
-            'cloud_cover', 'pressure', 'precipitation', 'probability',
-            'ozone', 'humidity', 'snow_depth', 'visibility'}
-ASTRO = {'sun', 'moon'}
+ALL_DAY = frozenset({
+    'weather', 'icon', 'temperature', 'temperature_min',
+    'temperature_max', 'feels_like', 'feels_like_min', 'feels_like_max',
+    'soil_temperature', 'soil_temperature_min', 'soil_temperature_max',
+    'wind_chill', 'wind_chill_min', 'wind_chill_max', 'dew_point',
+    'dew_point_min', 'dew_point_max', 'surface_temperature',
+    'surface_temperature_min', 'surface_temperature_max', 'wind',
+    'cloud_cover', 'pressure', 'precipitation', 'probability',
+    'ozone', 'humidity', 'snow_depth', 'visibility'})
 
-SUN = {'rise', 'set', 'always_up', 'always_down'}
+PART_DAY = frozenset({
+    'weather', 'icon', 'temperature', 'feels_like', 'soil_temperature',
+    'wind_chill', 'dew_point', 'surface_temperature', 'wind',
+    'cloud_cover', 'pressure', 'precipitation', 'probability',
+    'ozone', 'humidity', 'snow_depth', 'visibility'})
 
-MOON = {'rise', 'set', 'always_up', 'always_down', 'phase'}
+ASTRO = frozenset({'sun', 'moon'})
 
-STATS = {'temperature', 'wind', 'precipitation'}
+SUN = frozenset({'rise', 'set', 'always_up', 'always_down'})
 
-STATS_TEMP = {'avg', 'avg_min', 'avg_max', 'record_min', 'record_max'}
-STATS_WIND = {'avg_speed', 'avg_angle', 'avg_dir', 'max_speed', 'max_gust'}
-STATS_PREC = {'avg', 'probability'}
-ALERTS = {'event', 'onset', 'expires', 'sender', 'certainty', 'severity',
-          'headline', 'description'}
+MOON = frozenset({'rise', 'set', 'always_up', 'always_down', 'phase'})
+
+STATS = frozenset({'temperature', 'wind', 'precipitation'})
+
+STATS_TEMP = frozenset({'avg', 'avg_min', 'avg_max', 'record_min',
+                        'record_max'})
+STATS_WIND = frozenset({'avg_speed', 'avg_angle', 'avg_dir', 'max_speed',
+                        'max_gust'})
+STATS_PREC = frozenset({'avg', 'probability'})
+ALERTS = frozenset({'event', 'onset', 'expires', 'sender', 'certainty',
+                    'severity', 'headline', 'description'})
+
+# The expected nested layout of the forecast sections, as
+# (members, children) pairs walked by assert_layout in test_api
+_WIND_SPEC = (WIND, {})
+LAYOUT = {
+    'current': (CURRENT, {'wind': _WIND_SPEC,
+                          'precipitation': (PRECIPITATION_CURRENT, {})}),
+    'minutely': (MINUTELY, {}),
+    'hourly': (HOURLY, {'wind': _WIND_SPEC,
+                        'cloud_cover': (CLOUD, {}),
+                        'precipitation': (PRECIPITATION, {}),
+                        'probability': (PROBABILITY, {})}),
+    'daily': (DAILY, {'all_day': (ALL_DAY, {'wind': _WIND_SPEC}),
+                      'morning': (PART_DAY, {'wind': _WIND_SPEC}),
+                      'afternoon': (PART_DAY, {'wind': _WIND_SPEC}),
+                      'evening': (PART_DAY, {'wind': _WIND_SPEC}),
+                      'astro': (ASTRO, {'sun': (SUN, {}),
+                                        'moon': (MOON, {})}),
+                      'statistics': (STATS,
+                                     {'temperature': (STATS_TEMP, {}),
+                                      'wind': (STATS_WIND, {}),
+                                      'precipitation': (STATS_PREC, {})})}),
+}